@@ -2,20 +2,56 @@ import Foundation
 import SwiftUI
 import Combine
 import AVFoundation
+import os
+
+private let logPath = NSHomeDirectory() + "/Library/Logs/Listen.log"
+
+/// Log file descriptor (-1 when closed), opened in append mode and kept across calls.
+/// Each line is a single O_APPEND write(2), so lines from different threads never interleave.
+private let logFileDescriptor = OSAllocatedUnfairLock<Int32>(initialState: -1)
+
+/// Append a line to the log file. Reopens the file if the path no longer refers to the
+/// open inode (deleted, or renamed away by newsyslog/logrotate), or if an earlier open
+/// or write failed.
+private func appendToLogFile(_ line: String) {
+    var line = line
+    logFileDescriptor.withLockUnchecked { fd in
+        if fd >= 0 {
+            var current = stat()
+            var onDisk = stat()
+            if fstat(fd, &current) != 0
+                || stat(logPath, &onDisk) != 0
+                || current.st_dev != onDisk.st_dev
+                || current.st_ino != onDisk.st_ino {
+                close(fd)
+                fd = -1
+            }
+        }
+        if fd < 0 {
+            fd = open(logPath, O_WRONLY | O_APPEND | O_CREAT | O_CLOEXEC, 0o644)
+            guard fd >= 0 else { return }
+        }
+        let descriptor = fd
+        let written = line.withUTF8 { bytes in
+            write(descriptor, bytes.baseAddress, bytes.count)
+        }
+        if written < 0 {
+            close(fd)
+            fd = -1
+        }
+    }
+}
+
+/// Shared timestamp formatter for log lines. Formatters are expensive to build,
+/// and ISO8601DateFormatter is thread-safe, so one lazily created instance serves every caller.
+private let logDateFormatter = ISO8601DateFormatter()
 
 /// Simple file logger so we can see logs even when launched via `open`.
 func listenLog(_ msg: String) {
-    let ts = ISO8601DateFormatter().string(from: Date())
+    let ts = logDateFormatter.string(from: Date())
     let line = "[\(ts)] \(msg)\n"
     NSLog("[Listen] \(msg)")
-    let logPath = NSHomeDirectory() + "/Library/Logs/Listen.log"
-    if let handle = FileHandle(forWritingAtPath: logPath) {
-        handle.seekToEndOfFile()
-        handle.write(line.data(using: .utf8) ?? Data())
-        handle.closeFile()
-    } else {
-        FileManager.default.createFile(atPath: logPath, contents: line.data(using: .utf8))
-    }
+    appendToLogFile(line)
 }
 
 /// Central state object that orchestrates all services.
@@ -42,8 +78,8 @@ final class AppState: ObservableObject {
     // MARK: - Config
     @Published var config = AppConfig()
 
-    /// Accumulated audio samples during recording.
-    private var audioSamples: [Float] = []
+    /// Accumulated audio samples during recording (appended from the audio tap thread).
+    private let audioSamples = SampleAccumulator()
     private var cancellables = Set<AnyCancellable>()
 
     init() {
@@ -194,7 +230,7 @@ final class AppState: ObservableObject {
         listenLog("START recording")
         isRecording = true
         statusText = "Recording..."
-        audioSamples = []
+        audioSamples.reset()
         soundEffects.playStartSound()
 
         // Wire audio levels to the waveform pill
@@ -205,12 +241,12 @@ final class AppState: ObservableObject {
         }
 
         // Accumulate audio samples for batch transcription on stop
-        audioCaptureService.onBuffer = { [weak self] buffer in
-            guard let self else { return }
+        let accumulator = audioSamples
+        audioCaptureService.onBuffer = { buffer in
             let frameLength = Int(buffer.frameLength)
             guard frameLength > 0, let channelData = buffer.floatChannelData else { return }
-            let samples = Array(UnsafeBufferPointer(start: channelData[0], count: frameLength))
-            self.audioSamples.append(contentsOf: samples)
+            // Append straight from the PCM buffer — no intermediate Array per chunk
+            accumulator.append(UnsafeBufferPointer(start: channelData[0], count: frameLength))
         }
 
         RecordingPillWindow.shared.show()
@@ -237,8 +273,7 @@ final class AppState: ObservableObject {
         audioCaptureService.stop()
 
         // Batch transcribe all accumulated audio
-        let samples = audioSamples
-        audioSamples = []
+        let samples = audioSamples.drain()
 
         guard !samples.isEmpty else {
             listenLog("No audio samples captured")
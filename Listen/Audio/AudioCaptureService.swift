@@ -7,10 +7,13 @@ final class AudioCaptureService {
     private let engine = AVAudioEngine()
     private var isRunning = false
 
+    /// Output sample rate (Hz) expected by the Parakeet model.
+    static let sampleRate: Double = 16000
+
     /// The target format: 16kHz mono Float32.
     private let targetFormat = AVAudioFormat(
         commonFormat: .pcmFormatFloat32,
-        sampleRate: 16000,
+        sampleRate: AudioCaptureService.sampleRate,
         channels: 1,
         interleaved: false
     )!
@@ -18,10 +21,6 @@ final class AudioCaptureService {
     /// Audio format converter (proper polyphase resampling).
     private var converter: AVAudioConverter?
 
-    /// High-pass filter state for removing low-frequency rumble/hum.
-    private var hpPrevInput: Float = 0
-    private var hpPrevOutput: Float = 0
-
     private var chunkCount = 0
 
     /// Current audio level (RMS) — updated on every chunk from audio thread.
@@ -38,6 +37,13 @@ final class AudioCaptureService {
         return rc / (rc + dt)
     }
 
+    /// Express the single-pole high-pass as one biquad section [b0, b1, b2, a1, a2]
+    /// so it can run through Accelerate instead of a per-sample Swift loop.
+    private static func highPassCoefficients(alpha: Float) -> [Double] {
+        let a = Double(alpha)
+        return [a, -a, 0, -a, 0]
+    }
+
     /// Start capturing audio. Forwards buffers via `onBuffer` and levels via `onLevel`.
     func start() throws {
         guard !isRunning else { return }
@@ -48,19 +54,34 @@ final class AudioCaptureService {
         listenLog("Audio input format: \(inputFormat)")
         listenLog("Audio target format: \(targetFormat)")
 
-        // Create AVAudioConverter for proper resampling (polyphase, not linear interpolation)
-        guard let conv = AVAudioConverter(from: inputFormat, to: targetFormat) else {
-            throw AudioCaptureError.converterCreationFailed
+        // Create AVAudioConverter for proper resampling (polyphase, not linear interpolation).
+        // Reused across recordings while the input format is unchanged — only a device or
+        // format change needs a new converter; otherwise just flush its resampler state.
+        if let existing = converter, existing.inputFormat == inputFormat {
+            existing.reset()
+        } else {
+            guard let conv = AVAudioConverter(from: inputFormat, to: targetFormat) else {
+                throw AudioCaptureError.converterCreationFailed
+            }
+            conv.sampleRateConverterQuality = .max
+            self.converter = conv
         }
-        conv.sampleRateConverterQuality = .max
-        self.converter = conv
 
-        // Reset filter state
-        hpPrevInput = 0
-        hpPrevOutput = 0
+        // High-pass filter: ~80Hz cutoff removes rumble, AC hum, and mic handling noise.
+        // Owned by this session's tap closure, so filter state starts fresh and is never
+        // shared with (or freed under) a block from a previous session.
+        let hpAlpha = Self.highPassAlpha(cutoff: 80, sampleRate: Float(Self.sampleRate))
+        guard var highPass = vDSP.Biquad(
+            coefficients: Self.highPassCoefficients(alpha: hpAlpha),
+            channelCount: 1,
+            sectionCount: 1,
+            ofType: Float.self
+        ) else {
+            throw AudioCaptureError.filterCreationFailed
+        }
 
-        // High-pass filter coefficient: ~80Hz cutoff removes rumble, AC hum, and mic handling noise
-        let hpAlpha = Self.highPassAlpha(cutoff: 80, sampleRate: 16000)
+        // Filtered-sample scratch buffer, likewise owned by this session's tap closure.
+        var filterScratch: [Float] = []
 
         chunkCount = 0
 
@@ -70,7 +91,7 @@ final class AudioCaptureService {
             guard let self = self, let converter = self.converter else { return }
 
             // Use AVAudioConverter for high-quality resampling + automatic channel mixing
-            let ratio = inputFormat.sampleRate / 16000.0
+            let ratio = inputFormat.sampleRate / Self.sampleRate
             let outputFrames = AVAudioFrameCount(Double(buffer.frameLength) / ratio)
             guard outputFrames > 0 else { return }
 
@@ -101,32 +122,33 @@ final class AudioCaptureService {
             let frameLength = Int(outputBuffer.frameLength)
             guard frameLength > 0, let channelData = outputBuffer.floatChannelData else { return }
 
-            var samples = Array(UnsafeBufferPointer(start: channelData[0], count: frameLength))
-
-            // Apply single-pole high-pass filter: y[n] = alpha * (y[n-1] + x[n] - x[n-1])
-            // Removes frequencies below ~80Hz (rumble, AC hum, handling noise)
-            var prevIn = self.hpPrevInput
-            var prevOut = self.hpPrevOutput
-            for i in 0..<samples.count {
-                let x = samples[i]
-                prevOut = hpAlpha * (prevOut + x - prevIn)
-                prevIn = x
-                samples[i] = prevOut
+            let input = UnsafeBufferPointer(start: channelData[0], count: frameLength)
+
+            // Filter into a scratch buffer reused across callbacks — only reallocated
+            // if a larger buffer arrives, so the filter/RMS step doesn't allocate per chunk.
+            if filterScratch.count < frameLength {
+                filterScratch = [Float](repeating: 0, count: frameLength)
             }
-            self.hpPrevInput = prevIn
-            self.hpPrevOutput = prevOut
 
-            // Compute RMS and send to level callback for waveform visualization
             var rms: Float = 0
-            vDSP_rmsqv(samples, 1, &rms, vDSP_Length(samples.count))
+            filterScratch.withUnsafeMutableBufferPointer { scratch in
+                var samples = UnsafeMutableBufferPointer(rebasing: scratch[0..<frameLength])
+
+                // Apply single-pole high-pass filter: y[n] = alpha * (y[n-1] + x[n] - x[n-1])
+                // Removes frequencies below ~80Hz (rumble, AC hum, handling noise)
+                highPass.apply(input: input, output: &samples)
+
+                // Compute RMS for the level callback (waveform visualization)
+                vDSP_rmsqv(samples.baseAddress!, 1, &rms, vDSP_Length(frameLength))
+            }
             self.onLevel?(rms)
 
             self.chunkCount += 1
             if self.chunkCount == 1 {
-                listenLog("First audio chunk: \(samples.count) samples from \(buffer.frameLength) input frames")
+                listenLog("First audio chunk: \(frameLength) samples from \(buffer.frameLength) input frames")
             }
             if self.chunkCount % 100 == 0 {
-                listenLog("Audio chunk #\(self.chunkCount): \(samples.count) samples, RMS=\(String(format: "%.4f", rms))")
+                listenLog("Audio chunk #\(self.chunkCount): \(frameLength) samples, RMS=\(String(format: "%.4f", rms))")
             }
         }
 
@@ -142,17 +164,19 @@ final class AudioCaptureService {
         engine.stop()
         isRunning = false
         onBuffer = nil
-        converter = nil
         listenLog("Audio capture stopped after \(chunkCount) chunks")
     }
 
     enum AudioCaptureError: Error, LocalizedError {
         case converterCreationFailed
+        case filterCreationFailed
 
         var errorDescription: String? {
             switch self {
             case .converterCreationFailed:
                 return "Failed to create audio format converter"
+            case .filterCreationFailed:
+                return "Failed to create high-pass filter"
             }
         }
     }
@@ -0,0 +1,34 @@
+import Foundation
+import os
+
+/// Collects 16kHz mono samples from the audio tap thread for batch transcription.
+/// The unfair lock is only held for the append/swap itself, so the tap never waits on main-thread work.
+final class SampleAccumulator {
+    /// Capacity reserved up front for each recording (30s of capture audio), so typical
+    /// utterances are written into one buffer instead of regrowing and copying.
+    static let reservedSampleCount = Int(AudioCaptureService.sampleRate) * 30
+
+    private let samples = OSAllocatedUnfairLock<[Float]>(initialState: [])
+
+    /// Append samples. Called from the audio tap thread.
+    func append(_ buffer: UnsafeBufferPointer<Float>) {
+        samples.withLockUnchecked { $0.append(contentsOf: buffer) }
+    }
+
+    /// Take everything accumulated so far, leaving the accumulator empty.
+    func drain() -> [Float] {
+        samples.withLockUnchecked { state in
+            var taken: [Float] = []
+            swap(&taken, &state)
+            return taken
+        }
+    }
+
+    /// Discard any accumulated samples and reserve capacity for the next recording.
+    func reset() {
+        samples.withLockUnchecked { state in
+            state.removeAll()
+            state.reserveCapacity(Self.reservedSampleCount)
+        }
+    }
+}
@@ -16,7 +16,31 @@ final class GlobeKeyMonitor {
     private var keyDown = false
 
     /// The hotkey to listen for
-    var hotkey: AppConfig.Hotkey = .globe
+    var hotkey: AppConfig.Hotkey = .globe {
+        didSet { masks = HotkeyMasks(hotkey) }
+    }
+
+    /// Modifier masks derived from `hotkey` — computed once per hotkey change
+    /// rather than on every event in the tap callback.
+    private lazy var masks = HotkeyMasks(hotkey)
+
+    private struct HotkeyMasks {
+        static let allModifiers: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate, .maskSecondaryFn]
+        static let comboModifiers: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate]
+
+        /// The hotkey's own modifier flags.
+        let target: CGEventFlags
+        /// Modifiers that must not be held alongside a modifier-only hotkey.
+        let others: CGEventFlags
+        /// The hotkey's modifiers that a key combo requires.
+        let requiredCombo: CGEventFlags
+
+        init(_ hotkey: AppConfig.Hotkey) {
+            target = CGEventFlags(rawValue: UInt64(hotkey.modifiers))
+            others = Self.allModifiers.subtracting(target)
+            requiredCombo = target.intersection(Self.comboModifiers)
+        }
+    }
 
     /// When true, the next key event is captured as a new hotkey instead of triggering recording.
     var isRecordingHotkey = false
@@ -65,7 +89,7 @@ final class GlobeKeyMonitor {
                 if monitor.isRecordingHotkey {
                     if type == .flagsChanged {
                         // Only capture on press (flag appeared), not release
-                        let hasModifier = !flags.intersection([.maskCommand, .maskShift, .maskControl, .maskAlternate, .maskSecondaryFn]).isEmpty
+                        let hasModifier = !flags.intersection(HotkeyMasks.allModifiers).isEmpty
                         if hasModifier {
                             let captured = AppConfig.Hotkey.fromModifierEvent(keyCode: keyCode, flags: flags)
                             DispatchQueue.main.async {
@@ -88,8 +112,7 @@ final class GlobeKeyMonitor {
                 case .globe:
                     guard type == .flagsChanged else { break }
                     let fnPressed = flags.contains(.maskSecondaryFn)
-                    let otherModifiers: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate]
-                    let hasOther = !flags.intersection(otherModifiers).isEmpty
+                    let hasOther = !flags.intersection(HotkeyMasks.comboModifiers).isEmpty
 
                     if fnPressed && !hasOther && !monitor.keyDown {
                         monitor.keyDown = true
@@ -111,14 +134,11 @@ final class GlobeKeyMonitor {
 
                     if keyCode == targetKeyCode {
                         // Check if the modifier flag for this key is now set
-                        let targetModFlags = CGEventFlags(rawValue: UInt64(monitor.hotkey.modifiers))
-                        let modPressed = !flags.intersection(targetModFlags).isEmpty
+                        let modPressed = !flags.intersection(monitor.masks.target).isEmpty
 
                         if modPressed && !monitor.keyDown {
                             // Make sure no OTHER modifiers are held
-                            let allMods: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate, .maskSecondaryFn]
-                            let otherMods = allMods.subtracting(targetModFlags)
-                            let hasOther = !flags.intersection(otherMods).isEmpty
+                            let hasOther = !flags.intersection(monitor.masks.others).isEmpty
                             if !hasOther {
                                 monitor.keyDown = true
                                 DispatchQueue.main.async {
@@ -139,12 +159,9 @@ final class GlobeKeyMonitor {
                     // For key combos, keyDown = press, we detect release via flagsChanged or keyUp
                     if type == .keyDown && keyCode == monitor.hotkey.keyCode {
                         // Check modifiers match
-                        let requiredMods = CGEventFlags(rawValue: UInt64(monitor.hotkey.modifiers))
-                        let relevantFlags: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate]
-                        let currentMods = flags.intersection(relevantFlags)
-                        let requiredRelevant = requiredMods.intersection(relevantFlags)
+                        let currentMods = flags.intersection(HotkeyMasks.comboModifiers)
 
-                        if currentMods == requiredRelevant && !monitor.keyDown {
+                        if currentMods == monitor.masks.requiredCombo && !monitor.keyDown {
                             monitor.keyDown = true
                             DispatchQueue.main.async {
                                 listenLog("HOTKEY: \(monitor.hotkey.displayName) DOWN")
@@ -157,13 +174,11 @@ final class GlobeKeyMonitor {
                         }
                     } else if type == .flagsChanged && monitor.keyDown {
                         // If a modifier was part of the combo and it's now released, fire up
-                        let requiredMods = CGEventFlags(rawValue: UInt64(monitor.hotkey.modifiers))
-                        let relevantFlags: CGEventFlags = [.maskCommand, .maskShift, .maskControl, .maskAlternate]
-                        let requiredRelevant = requiredMods.intersection(relevantFlags)
+                        let requiredCombo = monitor.masks.requiredCombo
 
-                        if !requiredRelevant.isEmpty {
-                            let currentMods = flags.intersection(relevantFlags)
-                            if currentMods != requiredRelevant {
+                        if !requiredCombo.isEmpty {
+                            let currentMods = flags.intersection(HotkeyMasks.comboModifiers)
+                            if currentMods != requiredCombo {
                                 monitor.keyDown = false
                                 DispatchQueue.main.async {
                                     listenLog("HOTKEY: \(monitor.hotkey.displayName) UP (modifier released)")
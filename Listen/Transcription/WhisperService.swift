@@ -7,7 +7,14 @@ final class WhisperService {
     private var asrManager: AsrManager?
 
     /// Download (if needed) and load the Parakeet v2 model.
+    /// No-op after a completed load. Not guarded against overlapping calls —
+    /// AppState.bootstrap is the only caller.
     func loadModel() async throws {
+        guard asrManager == nil else {
+            listenLog("WhisperService: model already loaded, reusing")
+            return
+        }
+
         listenLog("WhisperService: downloading/loading Parakeet TDT 0.6B v2 (English-only)...")
 
         let models = try await AsrModels.downloadAndLoad(version: .v2)